@@ -23,7 +23,7 @@ mehtod when needed in adapters like rv_session.
 
 def get_rv_path():
     for p in os.environ.get('PATH', '').split(os.pathsep):
-        if re.search('rv-[\w-]+([0-9]+\.[0-9]+\.[0-9]+)', p):
+        if re.search(r'rv-[\w-]+([0-9]+\.[0-9]+\.[0-9]+)', p):
             return p
 
     return None
@@ -58,13 +58,11 @@ def main():
             index = 0
             if len(results) > 1:
                 alternatives = '\n'.join(
-                    ['{i}, {p}'.format(i=i, p=r.target_url)
-                     for i, r in enumerate(results)]
+                    f'{i}, {r.target_url}' for i, r in enumerate(results)
                 )
                 index = raw_input(
-                    'Several hits found for {c}:\n{results}\n'
+                    f'Several hits found for {clip.name}:\n{alternatives}\n'
                     'Please enter index of the one you like? [0]: '
-                    .format(c=clip.name, results=alternatives)
                 ) or 0
 
                 if index > len(results) - 1:
@@ -27,6 +27,13 @@ It uses OIIO to fetch metadata from source files.
 Frame numbers of source files will be used to match against clip's
 source_range for image formats without TimeCode, like jpg's etc.
 
+Findings are kept between sessions in a JSON file, by default
+~/.cache/otio_imagesequence_plugin/file_cache.json. Set the environment
+variable OTIO_IMAGESEQUENCE_CACHE to the path of another file, or to an
+empty string to disable it. Cached directories are checked against their
+modification time and files against their modification time and size
+before findings are reused.
+
 Example usage:
 
 OTIO_PLUGIN_MANIFEST_PATH=../plugin_manifest.json \
@@ -43,12 +50,24 @@ import os
 import sys
 import re
 import time
-import copy
-import operator
+import string
+import json
+import functools
+import bisect
+import atexit
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-import OpenImageIO as oiio
 import opentimelineio as otio
 
+# RE2 matches in linear time, which guards against slow user patterns.
+# Unlike re its character classes like \w and \d only match ASCII, so it's
+# only used for patterns where both engines give the same result
+try:
+    import re2
+
+except ImportError:  # pragma: nocover
+    re2 = None
+
 
 # Load our custom schemadef
 otio.schema.schemadef.from_name('image_reference')
@@ -64,8 +83,228 @@ USE_FIRST = (
     'console' in sys.argv[0] or os.path.basename(sys.argv[0]) in console_tools
 )
 
-# Regex to locate frame number
-frame_regex = re.compile('(?<=[._])[0-9]+(?=\.\w+$)')
+# File keeping findings between sessions. Set to an empty string to disable
+CACHE_PATH = os.environ.get(
+    'OTIO_IMAGESEQUENCE_CACHE',
+    os.path.join(
+        os.path.expanduser('~'),
+        '.cache',
+        'otio_imagesequence_plugin',
+        'file_cache.json'
+    )
+)
+
+# Layout version of file at CACHE_PATH. Files of other versions are ignored
+CACHE_VERSION = 6
+
+# Attribute holding frame rate per file extension
+FPS_ATTRIBUTES = dict(
+    exr='FramesPerSecond',
+    dpx='dpx:FrameRate'
+)
+
+# File formats which may hold TimeCode. Other files are never opened
+TIMECODE_FORMATS = frozenset(['exr', 'dpx'])
+
+# Leading bytes of files which may hold TimeCode
+MAGIC_NUMBERS = dict(
+    exr=(b'\x76\x2f\x31\x01',),
+    dpx=(b'SDPX', b'XPDS')
+)
+
+# Number of threads reading directories
+DIG_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Number of threads reading metadata from files
+PROBE_WORKERS = (os.cpu_count() or 1) * 2
+
+# Digs kept in cache. Least recently used ones are dropped with their files
+MAX_DIGS = 64
+
+# Results of naming checks kept per sequence
+MAX_PATTERNS = 16
+
+
+# Escapes matching differently in re and RE2
+UNICODE_ESCAPES = frozenset(
+    ['\\w', '\\W', '\\d', '\\D', '\\s', '\\S', '\\b', '\\B']
+)
+
+# Characters with special meaning in a regular expression
+REGEX_SPECIALS = frozenset('.^$*+?{}[]()|\\')
+
+# Keys of cached sequence data only used for lookups. Not passed on or saved
+INTERNAL_KEYS = frozenset(['valid_paths', 'frame_in', 'frame_out'])
+
+# Characters making up frame numbers in filenames
+DIGITS = frozenset(string.digits)
+
+
+def _literal_prefix(pattern):
+    """Get the literal path prefix of an anchored pattern. Used to avoid
+     digging into directories that can't hold any matches.
+
+    :param pattern: `str` regex pattern
+    :return: `str` or `None` if pattern isn't anchored to start of path
+    """
+
+    if not pattern.startswith('^') or '|' in pattern:
+        return None
+
+    prefix = list()
+    for char in pattern[1:]:
+        if char in REGEX_SPECIALS:
+            # Previous character is optional
+            if char in '*?{' and prefix:
+                prefix.pop()
+
+            break
+
+        prefix.append(char)
+
+    return ''.join(prefix) or None
+
+
+def _without_internal(data):
+    """Copy sequence data leaving out keys only used for lookups
+
+    :param data: `dict` cached data of sequence
+    :return: `dict`
+    """
+
+    return {
+        key: value for key, value in data.items()
+        if key not in INTERNAL_KEYS
+    }
+
+
+def _is_under(path, root):
+    """Check if path is root or lies below it, comparing whole directory
+     names so /x/r2 isn't taken as being under /x/r.
+
+    :param path: `str` path to check
+    :param root: `str` root directory
+    :return: `bool`
+    """
+
+    root = os.path.normpath(root)
+    try:
+        return os.path.commonpath([root, os.path.normpath(path)]) == root
+
+    # Mix of absolute and relative paths
+    except ValueError:
+        return False
+
+
+def _split_last_num(name):
+    """Split filename around the last number before the file extension.
+
+    :param name: `str` filename
+    :return: `tuple` with text before, the number and text after as `str`
+    """
+
+    stem, dot, ext = name.rpartition('.')
+    if not dot:
+        stem, ext = ext, ''
+
+    end = len(stem)
+    while end and stem[end - 1] not in DIGITS:
+        end -= 1
+
+    start = end
+    while start and stem[start - 1] in DIGITS:
+        start -= 1
+
+    if start == end:
+        return name, '', ''
+
+    return stem[:start], stem[start:end], stem[end:] + dot + ext
+
+
+def _frame_number(name):
+    """Split filename around its frame number. Like in `name.1001.exr` or
+     `name_1001.exr` the number must follow a dot or underscore and come
+     right before the file extension.
+
+    :param name: `str` filename
+    :return: `tuple` with text before, the frame number and text after as
+     `str`. Frame number is empty if there is none
+    """
+
+    head, number, tail = _split_last_num(name)
+    if (
+        not number or
+        head[-1:] not in ('.', '_') or
+        tail.count('.') != 1 or
+        not tail.startswith('.')
+    ):
+        return name, '', ''
+
+    return head, number, tail
+
+
+def _index_key(identifier):
+    """Get the key used to index a sequence by file extension
+
+    :param identifier: `str` filename with hashed frame number
+    :return: `str` lower case extension without leading dot
+    """
+
+    _, ext = os.path.splitext(identifier)
+
+    return ext[1:].lower()
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_regex(pattern, ext):
+    """Compile regex matching full path of files we're looking for. Cached
+     as the same arguments are used for every clip in a timeline.
+
+    :param pattern: `str` regex pattern to narrow down the search
+    :param ext: `str` file extension
+    :return: compiled regex
+    """
+
+    regex = rf'({pattern}).*(\.{ext})$'
+    if (
+        re2 is not None and
+        regex.isascii() and
+        not any(escape in regex for escape in UNICODE_ESCAPES)
+    ):
+        # Fall back to re for syntax RE2 doesn't support, like backreferences
+        try:
+            return re2.compile(regex)
+
+        except re2.error:
+            pass
+
+    return re.compile(regex)
+
+
+@functools.lru_cache(maxsize=None)
+def _oiio():
+    """Import OpenImageIO on first use. Loading it takes a while and isn't
+     needed when lookups are answered from the cache or by frame numbers.
+
+    :return: `OpenImageIO` module
+    """
+
+    import OpenImageIO
+
+    return OpenImageIO
+
+
+@functools.lru_cache(maxsize=4096)
+def _from_timecode(timecode, rate):
+    """Convert TimeCode to RationalTime. Cached as sequences of a shot share
+     their TimeCodes across clips and lookups.
+
+    :param timecode: `str` TimeCode
+    :param rate: `float` frame rate
+    :return: `otio.opentime.RationalTime`
+    """
+
+    return otio.opentime.from_timecode(timecode, rate=rate)
 
 
 # Timer decorator used under development to measure time spent
@@ -75,26 +314,24 @@ def timeit(method):     # pragma: nocover
         result = method(*args, **kw)
         te = time.time()
 
-        print ('\nfunc: %s, %2.6f sec' % (method.__name__, te - ts))
+        print('\nfunc: %s, %2.6f sec' % (method.__name__, te - ts))
         return result
     return timed
 
 
-def get_fps(buf):
+def get_fps(buf, spec=None):
     """Get frame rate from source ImageBuf
 
     :param buf: `oiio.ImageBuf`
+    :param spec: `oiio.ImageSpec` of buf if already fetched
     :return: `float` or `None`
     """
 
-    spec = buf.spec()
-    attrlut = dict(
-        exr='FramesPerSecond',
-        dpx='dpx:FrameRate'
-    )
+    if spec is None:
+        spec = buf.spec()
 
     _, ext = os.path.splitext(buf.name)
-    attrname = attrlut.get(ext[1:].lower())
+    attrname = FPS_ATTRIBUTES.get(ext[1:].lower())
 
     if attrname:
         value = spec.getattribute(attrname)
@@ -109,234 +346,877 @@ def get_fps(buf):
     return None
 
 
-def get_timecode_str(buf):
+def get_timecode_str(buf, spec=None):
     """Get TimeCode from source ImageBuf
 
     :param buf: `oiio.ImageBuf`
+    :param spec: `oiio.ImageSpec` of buf if already fetched
     :return: `str` or `None`
     """
 
-    spec = buf.spec()
+    if spec is None:
+        spec = buf.spec()
+
     tc = spec.getattribute('timecode')
 
     if not tc:
-        if oiio.VERSION < 20000:
+        if _oiio().VERSION < 20000:
             tc_param = next(
                 (i for i in spec.extra_attribs if i.name == 'smpte:TimeCode'),
                 None
             )
-            tc_bin = tc_param and tc_param.value or None
+            tc_bin = tc_param.value if tc_param else None
 
         else:
             tc_param = spec.getattribute('smpte:TimeCode')
-            tc_bin = tc_param and int(tc_param[0]) or None
+            tc_bin = int(tc_param[0]) if tc_param else None
 
         if tc_bin:
-            bits = range(0, 32, 8)
-            tc = ':'.join(
-                [
-                    '{0:02d}'.format(int(hex((tc_bin >> i) & 0xff)[2:]))
-                    for i in bits[::-1]
-                ]
+            # Each byte holds two binary coded decimal digits which read the
+            # same in hex. Drop frame and other flag bits are masked off
+            tc = '%02x:%02x:%02x:%02x' % (
+                (tc_bin >> 24) & 0x3f,
+                (tc_bin >> 16) & 0x7f,
+                (tc_bin >> 8) & 0x7f,
+                tc_bin & 0x3f
             )
 
     return tc
 
 
+def _probe_buf(buf):
+    """Get TimeCode and frame rate from source ImageBuf fetching its spec
+     only once
+
+    :param buf: `oiio.ImageBuf`
+    :return: `dict` with tc and fps
+    """
+
+    spec = buf.spec()
+
+    return dict(
+        tc=get_timecode_str(buf, spec=spec),
+        fps=get_fps(buf, spec=spec)
+    )
+
+
+def _probe_file(path, probes):
+    """Read TimeCode and frame rate from a file. Results are kept in probes
+     and reused as long as the file's modification time and size are the
+     same.
+
+    :param path: `str` full path to file
+    :param probes: `dict` with earlier results by path
+    :return: `dict` with tc and fps or `None` if file can't be read
+    """
+
+    try:
+        stat = os.stat(path)
+
+    except OSError:
+        return None
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    known = probes.get(path)
+    if known and known[0] == signature:
+        return known[1]
+
+    # Files not starting like their format can't hold TimeCode. Checking
+    # this is cheaper than opening them with OIIO
+    magic = MAGIC_NUMBERS.get(_index_key(path))
+    if magic:
+        try:
+            with open(path, 'rb') as f:
+                head = f.read(4)
+
+        except OSError:
+            return None
+
+        if not head.startswith(magic):
+            probed = dict(tc=None, fps=None)
+            probes[path] = (signature, probed)
+
+            return probed
+
+    buf = _oiio().ImageBuf(path)
+    if buf.has_error:
+        return None
+
+    probed = _probe_buf(buf)
+    probes[path] = (signature, probed)
+
+    return probed
+
+
+def _scan_dir(dirpath, suffix, prefix):
+    """Read the contents of a single directory. Run in worker threads by
+     `FileCache.dig_for_files`
+
+    :param dirpath: `str` directory to read
+    :param suffix: `str` only list files ending with this
+    :param prefix: `str` literal start of path subdirectories must match
+    :return: `tuple` with dirpath, its modification time, subdirectories and
+     filenames. Modification time is `None` if directory can't be read
+    """
+
+    subdirs = list()
+    filenames = list()
+    try:
+        mtime = os.stat(dirpath).st_mtime_ns
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    path = entry.path
+                    if (
+                        not prefix or
+                        prefix.startswith(path) or
+                        path.startswith(prefix)
+                    ):
+                        subdirs.append(path)
+
+                    continue
+
+                filename = entry.name
+                if not filename.endswith(suffix):
+                    continue
+
+                # Only symlinks need an extra stat here
+                if entry.is_file():
+                    filenames.append(filename)
+
+    except OSError:
+        return dirpath, None, list(), list()
+
+    return dirpath, mtime, subdirs, filenames
+
+
 class FileCache(object):
     """ Cache to look for new files and hold account of what it previously
      found along the way for faster lookup later on.
 
     """
 
-    __slots__ = ['file_cache']
+    __slots__ = [
+        'file_cache',
+        'ext_index',
+        'digs',
+        'probes',
+        'unchecked',
+        'cache_path',
+        'loaded',
+        'changed'
+    ]
+
+    def __init__(self, root=None, ext=None, prefix=None, cache_path=None):
+        self.file_cache = dict()
+        self.ext_index = dict()
+        self.digs = dict()
+        self.probes = dict()
+
+        # Digs loaded from cache_path not yet checked for changes on disk
+        self.unchecked = set()
+        self.cache_path = cache_path
+        self.loaded = False
+        self.changed = False
 
-    file_cache = dict()
-
-    def __new__(cls, *args, **kwargs):
-        return super(FileCache, cls).__new__(cls, *args, **kwargs)
-
-    def __init__(self, root=None):
         if root:
-            self.dig_for_files(root)
+            self.dig_for_files(root, ext=ext, prefix=prefix)
 
     # @timeit
-    def dig_for_files(self, root):
-        """Dig for all files under the given root and store findings
+    def dig_for_files(self, root, ext=None, prefix=None):
+        """Dig for files under the given root and store findings
          in the cache.
 
         :param root: `str` root location to begin digging for files
+        :param ext: `str` only store files with this extension
+        :param prefix: `str` literal start of the path files must match.
+         Directories outside of it are not entered
+        :return: None
+        """
+
+        self.ensure_loaded()
+        suffix = f'.{ext}' if ext else ''
+
+        # Modification times of directories dug in
+        mtimes = dict()
+        self.unchecked.discard((root, ext, prefix))
+        self.changed = True
+
+        start = root
+        if prefix and _is_under(prefix, root):
+            # Begin digging at the deepest directory given by the pattern
+            start = os.path.dirname(prefix)
+            while len(start) > len(root) and not os.path.isdir(start):
+                start = os.path.dirname(start)
+
+            if not _is_under(start, root):
+                start = root
+
+        # Directories are read in threads as this is I/O bound. Findings are
+        # stored here in the main thread
+        with ThreadPoolExecutor(max_workers=DIG_WORKERS) as executor:
+            pending = {executor.submit(_scan_dir, start, suffix, prefix)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    dirpath, mtime, subdirs, filenames = future.result()
+                    for subdir in subdirs:
+                        pending.add(
+                            executor.submit(_scan_dir, subdir, suffix, prefix)
+                        )
+
+                    if mtime is None:
+                        # Keep a missing start so later sessions look again
+                        if dirpath == start:
+                            mtimes[dirpath] = None
+
+                        continue
+
+                    # Share one copy of the path between caches and digs of
+                    # overlapping roots
+                    dirpath = sys.intern(dirpath)
+                    mtimes[dirpath] = mtime
+                    self.store_files(dirpath, suffix, filenames)
+
+        # Forget directories this dig should have come across but didn't.
+        # They were removed since an earlier dig
+        self.forget_dirs([
+            dirpath for dirpath in self.file_cache
+            if dirpath not in mtimes and _is_under(dirpath, start) and (
+                not prefix or
+                prefix.startswith(dirpath) or
+                dirpath.startswith(prefix)
+            )
+        ])
+
+        # Paths are sorted once here to keep lookups in a predictable order
+        # and to let dirs_from_parent_dig bisect them
+        self.digs.pop((root, ext, prefix), None)
+        self.digs[(root, ext, prefix)] = dict(
+            mtimes=mtimes,
+            dirpaths=tuple(sorted(mtimes))
+        )
+
+        if len(self.digs) > MAX_DIGS:
+            self.evict()
+
+    def store_files(self, dirpath, suffix, filenames):
+        """Group files of a directory into sequences and store them in the
+         cache, replacing earlier findings with the same suffix.
+
+        :param dirpath: `str` directory holding the files
+        :param suffix: `str` suffix of all files passed
+        :param filenames: `list` of filenames found in directory
+        :return: None
+        """
+
+        found = dict()
+        for filename in filenames:
+            # identifier used to collect related images
+            head, number, tail = _split_last_num(filename)
+            identifier = head + '#' + tail if number else filename
+
+            # Avoid building a throwaway dict for every file
+            try:
+                found[identifier]['files'].append(filename)
+
+            except KeyError:
+                found[identifier] = dict(files=[filename])
+
+        dir_cache = self.file_cache.get(dirpath, dict())
+
+        # Forget sequences removed since a previous dig
+        for identifier in list(dir_cache):
+            if identifier.endswith(suffix) and identifier not in found:
+                del dir_cache[identifier]
+                self.ext_index.get(
+                    _index_key(identifier),
+                    dict()
+                ).get(dirpath, dict()).pop(identifier, None)
+
+        if not found:
+            return
+
+        self.file_cache[dirpath] = dir_cache
+        for identifier, data in found.items():
+            # Only the ends are needed unless sequence is a match
+            data['first'] = min(data['files'])
+            data['last'] = max(data['files'])
+
+            # Frame numbers and name of sequence used on a match
+            head, number, tail = _frame_number(data['first'])
+            data['first_frame'] = int(number) if number else None
+            data['name'] = data['first']
+            if number:
+                data['name'] = f'{head}%0{len(number)}d{tail}'
+
+            _, number, _ = _frame_number(data['last'])
+            data['last_frame'] = int(number) if number else None
+
+            self.ext_index.setdefault(
+                _index_key(identifier),
+                dict()
+            ).setdefault(dirpath, dict())[identifier] = None
+
+            dir_cache[identifier] = data
+
+    def forget_dirs(self, dirpaths):
+        """Remove directories and their sequences from the cache
+
+        :param dirpaths: `list` of directory paths
         :return: None
         """
 
-        self.file_cache.setdefault(root, dict())
+        for dirpath in dirpaths:
+            self.file_cache.pop(dirpath, None)
+            for dirs in self.ext_index.values():
+                dirs.pop(dirpath, None)
+
+            self.changed = True
+
+    def use_dig(self, key):
+        """Mark a dig as most recently used by moving it last in `digs`
+
+        :param key: `tuple` with root, ext and prefix of dig
+        :return: `dict` dig
+        """
+
+        dig = self.digs.pop(key)
+        self.digs[key] = dig
+
+        return dig
 
-        for dirpath, dirnames, filenames in os.walk(root, topdown=False):
-            if not filenames:
+    def evict(self):
+        """Drop least recently used digs beyond `MAX_DIGS` along with
+         directories and probes only they refer to
+
+        :return: None
+        """
+
+        while len(self.digs) > MAX_DIGS:
+            key = next(iter(self.digs))
+            del self.digs[key]
+            self.unchecked.discard(key)
+
+        self.prune()
+
+    def prune(self):
+        """Drop directories no dig refers to anymore, like those of digs found
+         outdated, and probes of files no longer first or last of a sequence.
+
+        :return: None
+        """
+
+        dug = set()
+        for dig in self.digs.values():
+            dug.update(dig['mtimes'])
+
+        self.forget_dirs([d for d in self.file_cache if d not in dug])
+
+        paths = set()
+        for dirpath, sequences in self.file_cache.items():
+            for data in sequences.values():
+                paths.add(os.path.join(dirpath, data['first']))
+                paths.add(os.path.join(dirpath, data['last']))
+
+        self.probes = {
+            path: probe for path, probe in self.probes.items()
+            if path in paths
+        }
+
+    def is_current(self, root, ext=None, prefix=None):
+        """Check if a dig with these arguments is cached and no files have
+         been added or removed since. Digs from previous sessions are checked
+         once against the modification time of the directories.
+
+        :param root: `str` root location of dig
+        :param ext: `str` file extension of dig
+        :param prefix: `str` literal path prefix of dig
+        :return: `bool`
+        """
+
+        key = (root, ext, prefix)
+        if key not in self.digs:
+            return False
+
+        if key in self.unchecked:
+            self.unchecked.discard(key)
+            for dirpath, mtime in self.digs[key]['mtimes'].items():
+                try:
+                    if os.stat(dirpath).st_mtime_ns == mtime:
+                        continue
+
+                except OSError:
+                    pass
+
+                # Outdated digs are of no further use
+                del self.digs[key]
+                return False
+
+        return True
+
+    def dirs_from_parent_dig(self, root, ext=None):
+        """Get directories under root from a dig of root or one of its parent
+         directories, avoiding a new dig of a tree we already know.
+
+        :param root: `str` root folder to look for files in
+        :param ext: `str` file extension to look for
+        :return: `tuple` of directory paths or `None` if no dig covers root
+        """
+
+        for dug_root, dug_ext, dug_prefix in list(self.digs):
+            if dug_prefix or dug_ext not in (ext, None):
+                continue
+
+            try:
+                rel = os.path.relpath(root, dug_root)
+
+            except ValueError:
+                continue
+
+            if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+                continue
+
+            if not self.is_current(dug_root, ext=dug_ext):
+                continue
+
+            dug = self.use_dig((dug_root, dug_ext, None))
+            base = dug_root
+            if rel != os.curdir:
+                base = os.path.join(dug_root, rel)
+
+            # Only reuse a directory found by the dig and unchanged since.
+            # Directories created later need a dig of their own
+            mtime = dug['mtimes'].get(base)
+            try:
+                if mtime is None or os.stat(base).st_mtime_ns != mtime:
+                    continue
+
+            except OSError:
                 continue
 
-            filenames.sort()
-            self.file_cache.setdefault(dirpath, dict())
+            dirpaths = dug['dirpaths']
+            if base == dug_root:
+                return dirpaths
 
-            for filename in filenames:
-                numbers = re.findall('[0-9]+', filename)
-                pat = numbers and numbers[-1] or '\a'
+            # Paths are sorted so the ones below root are next to each other
+            lower = bisect.bisect_left(dirpaths, base + os.sep)
+            upper = bisect.bisect_left(dirpaths, base + chr(ord(os.sep) + 1))
 
-                # identifier used to collect related images
-                identifier = re.sub(pat, '#', filename)
+            return (base,) + dirpaths[lower:upper]
 
-                self.file_cache[dirpath].setdefault(
-                    identifier,
-                    dict(files=list())
-                )['files'].append(filename)
+        return None
 
     # @timeit
     def locate_files(self, criteria, root=None, force=False):
         """Locate files which match the given criteria.
 
-        :param criteria: `dict` containing regex and timecode tests
+        :param criteria: `dict` containing regex and frame range
         :param root: `str` root folder to look for files in
-         `FileCache` will dig for files at this root if not found in cache
+         `FileCache` will dig for files at this root if not found in cache.
+         Without root, directories of earlier digs still current are searched
         :param force: `bool` Force a new dig at passed root in case of new files
-        :return:
+        :return: generator yielding dirname and `dict` with data of each
+         matching sequence
         """
 
-        results = dict()
-        if root:
-            if root not in self.file_cache or force:
-                self.dig_for_files(root)
+        self.ensure_loaded()
+        candidates = list()
+        ext = criteria.get('ext')
+        if not root:
+            # Directories of digs which still match what's on disk
+            dirnames = dict()
+            for key in list(self.digs):
+                if self.is_current(*key):
+                    dirnames.update(dict.fromkeys(self.digs[key]['dirpaths']))
+
+        else:
+            prefix = criteria.get('prefix')
+            if not force and self.is_current(root, ext=ext, prefix=prefix):
+                dirnames = self.use_dig((root, ext, prefix))['dirpaths']
+
+            else:
+                # Only directories below a pattern's literal path can match
+                subroot = root
+                if prefix and _is_under(prefix, root):
+                    subroot = max(root, os.path.dirname(prefix), key=len)
+
+                dirnames = None
+                if not force:
+                    dirnames = self.dirs_from_parent_dig(subroot, ext=ext)
 
-        for dirname, data in self.file_cache.items():
-            if root and root not in dirname:
+                if dirnames is None:
+                    self.dig_for_files(root, ext=ext, prefix=prefix)
+                    dirnames = self.digs[(root, ext, prefix)]['dirpaths']
+
+        index = self.ext_index.get(ext.lower(), dict()) if ext else None
+
+        for dirname in dirnames:
+            data = self.file_cache.get(dirname)
+            if not data:
                 continue
 
-            for identifier, cache in data.items():
-                if not cache['files']:
-                    continue
+            identifiers = data if index is None else index.get(dirname, ())
+            for identifier in identifiers:
+                cache = data[identifier]
+                files = [cache['first'], cache['last']]
+                if self.check_naming(criteria, dirname, identifier, files):
+                    candidates.append((dirname, identifier, files))
 
-                files = [cache['files'][0], cache['files'][-1]]
+        # Files are probed in batches so matches are passed on without
+        # reading every candidate first
+        for start in range(0, len(candidates), PROBE_WORKERS):
+            batch = candidates[start:start + PROBE_WORKERS]
+            self.probe_files(batch)
+
+            for dirname, identifier, files in batch:
                 if self.check_criteria(criteria, dirname, identifier, files):
-                    results.update(
-                        {
-                            dirname: copy.deepcopy(
-                                self.file_cache[dirname][identifier]
-                            )
-                        }
+                    cache = self.file_cache[dirname][identifier]
+                    # Pass on a copy without mutable lookup data
+                    data = _without_internal(cache)
+                    data['files'] = sorted(cache['files'])
+
+                    yield dirname, data
+
+    def ensure_loaded(self):
+        """Load findings of previous sessions on first use rather than on
+         import, and save changes once when the session ends.
+
+        :return: None
+        """
+
+        if self.loaded:
+            return
+
+        self.loaded = True
+        if self.cache_path:
+            self.load()
+            atexit.register(self.save_changes)
+
+    def save_changes(self):
+        """Save findings to `cache_path` if anything changed since last save
+
+        :return: None
+        """
+
+        if self.changed:
+            self.save()
+            self.changed = False
+
+    def load(self):
+        """Load findings of previous sessions from `cache_path`
+
+        :return: None
+        """
+
+        try:
+            with open(self.cache_path, encoding='utf-8') as cache_file:
+                data = json.load(cache_file)
+
+            if data['version'] != CACHE_VERSION:
+                return
+
+            # Paths are shared between caches like when digging
+            file_cache = {
+                sys.intern(dirpath): sequences
+                for dirpath, sequences in data['file_cache'].items()
+            }
+            digs = {
+                (dig['root'], dig['ext'], dig['prefix']): dict(
+                    mtimes={
+                        sys.intern(dirpath): mtime
+                        for dirpath, mtime in dig['mtimes'].items()
+                    },
+                    dirpaths=tuple(sys.intern(d) for d in dig['dirpaths'])
+                )
+                for dig in data['digs']
+            }
+            probes = {
+                path: (tuple(signature), probed)
+                for path, (signature, probed) in data['probes'].items()
+            }
+
+        # A missing, outdated or broken cache file only means we need to dig
+        except Exception:
+            return
+
+        # Index by extension isn't saved as it's cheap to rebuild
+        ext_index = dict()
+        for dirpath, sequences in file_cache.items():
+            for identifier in sequences:
+                ext_index.setdefault(
+                    _index_key(identifier),
+                    dict()
+                ).setdefault(dirpath, dict())[identifier] = None
+
+        self.file_cache = file_cache
+        self.ext_index = ext_index
+        self.digs = digs
+        self.probes = probes
+        self.unchecked = set(self.digs)
+
+    def save(self):
+        """Save findings to `cache_path` for later sessions
+
+        :return: None
+        """
+
+        if not self.cache_path:
+            return
+
+        self.prune()
+
+        # JSON is used as loading it can't run code, unlike pickle
+        data = dict(
+            version=CACHE_VERSION,
+            file_cache={
+                dirpath: {
+                    identifier: _without_internal(sequence)
+                    for identifier, sequence in sequences.items()
+                }
+                for dirpath, sequences in self.file_cache.items()
+            },
+            digs=[
+                dict(root=root, ext=ext, prefix=prefix, **dig)
+                for (root, ext, prefix), dig in self.digs.items()
+            ],
+            probes=self.probes
+        )
+
+        tmp_path = f'{self.cache_path}.{os.getpid()}'
+        try:
+            cache_dir = os.path.dirname(self.cache_path)
+            if cache_dir and not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+
+            with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(data, cache_file, separators=(',', ':'))
+
+            os.replace(tmp_path, self.cache_path)
+
+        except (IOError, OSError):
+            pass
+
+    def probe_files(self, candidates):
+        """Read TimeCode and frame rate from first and last file of sequences.
+         Files unchanged since they were last read only cost a stat. Files
+         are read in parallel as this is I/O bound.
+
+        :param candidates: `list` of tuples with dirname, identifier and
+         first and last file found
+        :return: None
+        """
+
+        jobs = list()
+        for dirname, identifier, files in candidates:
+            cache = self.file_cache[dirname][identifier]
+
+            # Frame numbers are used for formats without TimeCode
+            if _index_key(identifier) not in TIMECODE_FORMATS:
+                cache.setdefault('tc_in', None)
+                cache.setdefault('tc_out', None)
+                cache.setdefault('fps', None)
+                continue
+
+            for index, filename in enumerate(files):
+                jobs.append((cache, index, os.path.join(dirname, filename)))
+
+        if not jobs:
+            return
+
+        with ThreadPoolExecutor(max_workers=PROBE_WORKERS) as executor:
+            probes = executor.map(
+                _probe_file,
+                [job[2] for job in jobs],
+                [self.probes] * len(jobs)
+            )
+
+            for (cache, index, _), probed in zip(jobs, probes):
+                if probed is not None:
+                    self.store_probe(cache, index, probed)
+
+    def store_probe(self, cache, index, probed):
+        """Store TimeCode and frame rate read from a file in the cache.
+
+        :param cache: `dict` cached data of sequence
+        :param index: `int` 0 for first and 1 for last file of sequence
+        :param probed: `dict` with tc and fps
+        :return: None
+        """
+
+        values = {('tc_in', 'tc_out')[index]: probed['tc']}
+        if index == 0:
+            values['fps'] = probed['fps']
+
+        # Nothing to update for files unchanged since they were last read
+        if all(
+            key in cache and cache[key] == value
+            for key, value in values.items()
+        ):
+            return
+
+        cache.update(values)
+
+        # Frame counts worked out from earlier TimeCode and frame rate
+        cache.pop('frame_in', None)
+        cache.pop('frame_out', None)
+        self.changed = True
+
+    def check_naming(self, criteria, dirname, identifier, files):
+        """Check that the passed files match the naming we're looking for.
+
+        :param criteria: `dict` containing regex and frame range
+        :param dirname: str` with dirname of file location
+        :param identifier: `str` filename with hashed frame number
+        :param files: `list` of first and last file found
+        :return: `bool` reflecting a match or not
+        """
+
+        # Result is kept per pattern
+        cache = self.file_cache[dirname][identifier]
+        valid_paths = cache.setdefault('valid_paths', dict())
+        pattern = criteria['regex'].pattern
+        if pattern not in valid_paths:
+            # Keep memory in check for hosts running many patterns
+            if len(valid_paths) >= MAX_PATTERNS:
+                valid_paths.clear()
+
+            literal = criteria.get('literal')
+            if literal is not None:
+                # Plain string checks do the same as the regex without it
+                suffix = f'.{criteria["ext"]}'
+                valid_paths[pattern] = all(
+                    path.endswith(suffix) and
+                    literal in path[:-len(suffix)]
+                    for path in (
+                        os.path.join(dirname, filename) for filename in files
                     )
+                )
 
-        return results
+            else:
+                valid_paths[pattern] = all(
+                    criteria['regex'].search(os.path.join(dirname, filename))
+                    for filename in files
+                )
+
+        return valid_paths[pattern]
 
     # @timeit
     def check_criteria(self, criteria, dirname, identifier, files):
-        """Check that the passed files match the timecode and naming we're
-          looking for. Alternatively it will attempt to match frame number
-          against source_range
+        """Check that the passed files match the timecode we're looking for.
+          Alternatively it will attempt to match frame number against
+          source_range
 
-        :param criteria: `dict` containing regex and timecode tests
+        :param criteria: `dict` containing regex and frame range
         :param dirname: str` with dirname of file location
         :param identifier: `str` filename with hashed frame number
         :param files: `list` of first and last file found
         :return: `bool` reflecting a match or not
         """
 
-        testname = 'timecode'
+        cache = self.file_cache[dirname][identifier]
 
         for index, filename in enumerate(files):
-            fullpath = os.path.join(dirname, filename)
+            # Only open files with OIIO when we lack metadata
+            tc_key = ('tc_in', 'tc_out')[index]
+            if tc_key not in cache:
+                probed = _probe_file(
+                    os.path.join(dirname, filename),
+                    self.probes
+                )
+                if probed is None:
+                    return False
 
-            valid_path = criteria['regex'].search(fullpath)
-            if not valid_path:
-                return False
+                self.store_probe(cache, index, probed)
 
-            buf = oiio.ImageBuf(fullpath)
-            if buf.has_error:
-                return False
+            value = cache[tc_key]
 
-            if index == 0:
-                value = self.file_cache[dirname][identifier].setdefault(
-                    'tc_in',
-                    get_timecode_str(buf)
+            if value:
+                # Frame count of TimeCode is kept per rate we compare at
+                rate = criteria['rate']
+                frames = cache.setdefault(
+                    ('frame_in', 'frame_out')[index],
+                    dict()
                 )
-                self.file_cache[dirname][identifier].setdefault(
-                    'fps',
-                    get_fps(buf)
-                )
-            else:
-                value = get_timecode_str(buf)
+                if rate not in frames:
+                    try:
+                        frames[rate] = int(
+                            round(
+                                _from_timecode(
+                                    value,
+                                    cache['fps'] or rate
+                                ).rescaled_to(rate).value
+                            )
+                        )
+
+                    # TimeCode not valid at this rate. Not a match
+                    except ValueError:
+                        frames[rate] = None
+
+                value = frames[rate]
 
             # No TimeCode found. Try using frame number
-            if not value:
-                testname = 'frames'
-                try:
-                    if index == 0:
-                        value = self.file_cache[dirname][identifier].setdefault(
-                            'first_frame',
-                            int(frame_regex.search(filename).group())
-                        )
-                    else:
-                        value = int(frame_regex.search(filename).group())
+            else:
+                value = cache[('first_frame', 'last_frame')[index]]
 
-                except (ValueError, AttributeError):
-                    value = None
+            # Sequence must start before and end after clip's source_range
+            if value is None:
+                return False
 
-            func, test_value = criteria['tests'][testname][index]
+            if index == 0:
+                if value > criteria['start_frame']:
+                    return False
 
-            if not func(test_value, value):
+            elif value < criteria['end_frame']:
                 return False
 
         return True
 
 
-def create_sequence_reference(in_clip, dirname, data):
+# FileCache used by link_media_reference
+_file_cache = FileCache(cache_path=CACHE_PATH)
+
+
+def create_sequence_reference(in_clip, dirname, data, rate=None):
     """Create an ImageReference object to pass onto in_clip's
      media_reference.
 
     :param in_clip: `otio.schema.Clip`
     :param dirname: `str` with dirname of file location
     :param data: `dict` containing TimeCodes, fps and files found
+    :param rate: `float` frame rate of in_clip, looked up if not passed
     :return: `otio.schemadef.imagesequence_reference.ImageReference`
     """
 
-    duration = len(data['files'])
-    rate = data.get('fps') or in_clip.source_range.start_time.rate
-    frame_num = frame_regex.search(data['files'][0]).group()
+    RationalTime = otio.opentime.RationalTime
+    TimeRange = otio.opentime.TimeRange
+
+    rate = data.get('fps') or rate or in_clip.source_range.start_time.rate
+    duration = RationalTime(value=len(data['files']), rate=rate)
+
+    frame_start = None
+    if data['first_frame'] is not None:
+        frame_start = RationalTime(value=data['first_frame'], rate=rate)
 
     if data['tc_in']:
-        start_time = otio.opentime.from_timecode(
-            data['tc_in'] or data['first_frame'],
-            rate=rate
-        )
+        start_time = _from_timecode(data['tc_in'], rate)
 
     else:
-        start_time = otio.opentime.RationalTime(
-            value=data['first_frame'],
-            rate=rate
-        )
+        start_time = frame_start
 
-    available_range = otio.opentime.TimeRange(
-        start_time,
-        otio.opentime.RationalTime(
-            value=duration,
-            rate=rate
-        )
-    )
-    frame_range = otio.opentime.TimeRange(
-        otio.opentime.RationalTime(
-            value=int(frame_num),
-            rate=rate
-        ),
-        otio.opentime.RationalTime(
-            value=duration,
-            rate=rate
-        )
-    )
+    available_range = TimeRange(start_time, duration)
 
-    name = frame_regex.sub('%0{n}d'.format(n=len(frame_num)), data['files'][0])
+    # Single files without frame number are numbered like their TimeCode
+    frame_range = available_range
+    if frame_start is not None:
+        frame_range = TimeRange(frame_start, duration)
+
+    name = data['name']
     fullpath = os.path.join(dirname, name)
 
     seq = otio.schemadef.image_reference.ImageReference()
     seq.name = name
-    # seq.target_url = 'file://{path}'.format(path=fullpath)
+    # seq.target_url = f'file://{fullpath}'
     seq.target_url = fullpath
     seq.available_range = available_range
     seq.frame_range = frame_range
@@ -363,66 +1243,52 @@ def link_media_reference(in_clip, media_linker_argument_map):
     pattern = media_linker_argument_map.get('pattern', '')
     ext = media_linker_argument_map.get('ext')
 
+    # Timecodes are compared as frame numbers at the clip's rate
+    rate = in_clip.source_range.start_time.rate
+    start_frame = in_clip.source_range.start_time.value
+    end_frame = (
+        in_clip.source_range.start_time +
+        in_clip.source_range.duration -
+        otio.opentime.RationalTime(1, rate)
+    ).value
+
+    # Patterns without special characters are matched as plain strings
+    literal = None
+    if not REGEX_SPECIALS.intersection(f'{pattern}{ext}'):
+        literal = pattern
+
     # Search criteria
     criteria = {
-        'regex': re.compile(
-            r'({pattern}).*(\.{ext})$'.format(pattern=pattern, ext=ext)
-        ),
-        'tests': {
-            'timecode': [
-                [
-                    operator.ge,
-                    otio.opentime.to_timecode(
-                        in_clip.source_range.start_time
-                    )
-                ],
-                [
-                    operator.le,
-                    otio.opentime.to_timecode(
-                        in_clip.source_range.start_time +
-                        in_clip.source_range.duration -
-                        otio.opentime.RationalTime(
-                            1,
-                            in_clip.source_range.start_time.rate
-                        )
-                    )
-                ]
-            ],
-            'frames': [
-                [
-                    operator.ge,
-                    in_clip.source_range.start_time.value
-                ],
-                [
-                    operator.le,
-                    (
-                        in_clip.source_range.start_time +
-                        in_clip.source_range.duration -
-                        otio.opentime.RationalTime(
-                            1,
-                            in_clip.source_range.start_time.rate
-                        )
-                    ).value
-                ]
-            ]
-        }
+        'regex': _compile_regex(pattern, ext),
+        'literal': literal,
+        'ext': ext,
+        'prefix': _literal_prefix(pattern),
+        'rate': rate,
+        'start_frame': start_frame,
+        'end_frame': end_frame
     }
 
-    cache = FileCache()
-    results = cache.locate_files(criteria, root=root)
-
-    candidates = list()
-    for dirname, data in results.items():
+    located = _file_cache.locate_files(criteria, root=root)
+    matches = (
+        (dirname, data) for dirname, data in located
         # If we have a clip name we'd prefer using files that match
-        if in_clip.name and in_clip.name not in data['files'][0]:
-            continue
-
-        seq = create_sequence_reference(in_clip, dirname, data)
-        candidates.append(seq)
+        if not in_clip.name or in_clip.name in data['files'][0]
+    )
 
     # Use the first hit when linker is used with OTIO console tools.
-    if candidates and USE_FIRST:
-        return candidates[0]
+    # The search stops there and only the winning match gets a reference
+    if USE_FIRST:
+        match = next(matches, None)
+        located.close()
+        if match is None:
+            return None
+
+        return create_sequence_reference(in_clip, *match, rate)
 
     # When linker is used in custom applications you may want to choose best fit
+    candidates = [
+        create_sequence_reference(in_clip, dirname, data, rate)
+        for dirname, data in matches
+    ]
+
     return candidates or None
@@ -94,9 +94,7 @@ class ImageReference(otio.schema.ExternalReference):
         )
 
     def __str__(self):
-        return 'ImageReference("{}")'.format(self.target_url)
+        return f'ImageReference("{self.target_url}")'
 
     def __repr__(self):
-        return 'otio.schemadef.ImageReference(target_url={})'.format(
-            repr(self.target_url)
-        )
+        return f'otio.schemadef.ImageReference(target_url={self.target_url!r})'
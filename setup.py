@@ -16,6 +16,11 @@ setup(
             'plugin_manifest.json'
         ]
     },
+    extras_require={
+        're2': [
+            'google-re2'
+        ]
+    },
     keywords='plugin OpenTimelineIO image sequence',
     platforms='any',
     version='1.0.0',
@@ -0,0 +1,213 @@
+import os
+import tempfile
+import unittest
+
+# Register our schemadef and keep tests away from the user's cache file
+os.environ.setdefault(
+    'OTIO_PLUGIN_MANIFEST_PATH',
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        'otio_imagesequence_plugin',
+        'plugin_manifest.json'
+    )
+)
+os.environ['OTIO_IMAGESEQUENCE_CACHE'] = ''
+
+from otio_imagesequence_plugin.operations import imagesequence_linker  # noqa
+
+
+def touch(path):
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+
+    open(path, 'w').close()
+
+
+class TestLiteralPrefix(unittest.TestCase):
+    def test_unanchored(self):
+        self.assertIsNone(imagesequence_linker._literal_prefix('.*plate.*'))
+        self.assertIsNone(imagesequence_linker._literal_prefix('plate'))
+
+    def test_alternation(self):
+        self.assertIsNone(imagesequence_linker._literal_prefix('^/a|/b'))
+
+    def test_anchored(self):
+        self.assertEqual(
+            imagesequence_linker._literal_prefix('^/shows/sh010/.*'),
+            '/shows/sh010/'
+        )
+        self.assertEqual(
+            imagesequence_linker._literal_prefix('^/shows/sh010'),
+            '/shows/sh010'
+        )
+
+    def test_optional_character(self):
+        self.assertEqual(
+            imagesequence_linker._literal_prefix('^/shows/sh01*'),
+            '/shows/sh0'
+        )
+        self.assertEqual(
+            imagesequence_linker._literal_prefix('^/shows/sh01?'),
+            '/shows/sh0'
+        )
+        self.assertEqual(
+            imagesequence_linker._literal_prefix('^/shows/sh01{2}'),
+            '/shows/sh0'
+        )
+
+    def test_nothing_literal(self):
+        self.assertIsNone(imagesequence_linker._literal_prefix('^.*'))
+
+
+class TestSplitLastNum(unittest.TestCase):
+    def test_frame_number(self):
+        self.assertEqual(
+            imagesequence_linker._split_last_num('sh010.1001.exr'),
+            ('sh010.', '1001', '.exr')
+        )
+
+    def test_version_number(self):
+        self.assertEqual(
+            imagesequence_linker._split_last_num('plate_v003.jpg'),
+            ('plate_v', '003', '.jpg')
+        )
+
+    def test_text_after_number(self):
+        self.assertEqual(
+            imagesequence_linker._split_last_num('a1b.exr'),
+            ('a', '1', 'b.exr')
+        )
+
+    def test_no_extension(self):
+        self.assertEqual(
+            imagesequence_linker._split_last_num('sh010_1001'),
+            ('sh010_', '1001', '')
+        )
+
+    def test_no_number(self):
+        self.assertEqual(
+            imagesequence_linker._split_last_num('plate.exr'),
+            ('plate.exr', '', '')
+        )
+
+
+class TestFrameNumber(unittest.TestCase):
+    def test_frame_number(self):
+        self.assertEqual(
+            imagesequence_linker._frame_number('sh010.1001.exr'),
+            ('sh010.', '1001', '.exr')
+        )
+        self.assertEqual(
+            imagesequence_linker._frame_number('sh010_1001.exr'),
+            ('sh010_', '1001', '.exr')
+        )
+
+    def test_not_a_frame_number(self):
+        for name in [
+            'plate_v003.jpg',
+            'sh1001.exr',
+            'sh.1001',
+            'sh.1001.denoise.exr'
+        ]:
+            self.assertEqual(
+                imagesequence_linker._frame_number(name),
+                (name, '', '')
+            )
+
+
+class TestFileCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        for dirname in ['a', os.path.join('a', 'x'), 'a-b', 'c']:
+            for frame in [1001, 1002]:
+                touch(
+                    os.path.join(self.root, dirname, f'sh.{frame}.exr')
+                )
+
+        self.cache = imagesequence_linker.FileCache()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def path(self, *parts):
+        return os.path.join(self.root, *parts)
+
+    def test_is_current(self):
+        self.assertFalse(self.cache.is_current(self.root, ext='exr'))
+
+        self.cache.dig_for_files(self.root, ext='exr')
+        self.assertTrue(self.cache.is_current(self.root, ext='exr'))
+        self.assertFalse(self.cache.is_current(self.root, ext='jpg'))
+
+    def test_is_current_unchecked(self):
+        self.cache.dig_for_files(self.root, ext='exr')
+        key = (self.root, 'exr', None)
+
+        # Digs of earlier sessions are checked against disk once
+        self.cache.unchecked.add(key)
+        self.assertTrue(self.cache.is_current(self.root, ext='exr'))
+        self.assertNotIn(key, self.cache.unchecked)
+
+        mtime = self.cache.digs[key]['mtimes'][self.path('c')]
+        os.utime(self.path('c'), ns=(mtime + 1000, mtime + 1000))
+        self.cache.unchecked.add(key)
+        self.assertFalse(self.cache.is_current(self.root, ext='exr'))
+        self.assertNotIn(key, self.cache.digs)
+
+    def test_is_current_missing_start(self):
+        root = self.path('missing')
+        self.cache.dig_for_files(root, ext='exr')
+        self.cache.unchecked.add((root, 'exr', None))
+        self.assertFalse(self.cache.is_current(root, ext='exr'))
+
+    def test_dirs_from_parent_dig(self):
+        self.cache.dig_for_files(self.root, ext='exr')
+
+        self.assertEqual(
+            self.cache.dirs_from_parent_dig(self.root, ext='exr'),
+            tuple(sorted([
+                self.root,
+                self.path('a'),
+                self.path('a', 'x'),
+                self.path('a-b'),
+                self.path('c')
+            ]))
+        )
+        self.assertEqual(
+            self.cache.dirs_from_parent_dig(self.path('a'), ext='exr'),
+            (self.path('a'), self.path('a', 'x'))
+        )
+        self.assertEqual(
+            self.cache.dirs_from_parent_dig(self.path('c'), ext='exr'),
+            (self.path('c'),)
+        )
+
+    def test_dirs_from_parent_dig_not_covered(self):
+        self.cache.dig_for_files(self.path('a'), ext='exr')
+
+        # Parent and sibling directories aren't covered
+        self.assertIsNone(
+            self.cache.dirs_from_parent_dig(self.root, ext='exr')
+        )
+        self.assertIsNone(
+            self.cache.dirs_from_parent_dig(self.path('a-b'), ext='exr')
+        )
+
+        # Nor are other extensions
+        self.assertIsNone(
+            self.cache.dirs_from_parent_dig(self.path('a', 'x'), ext='jpg')
+        )
+
+    def test_dirs_from_parent_dig_new_directory(self):
+        self.cache.dig_for_files(self.root, ext='exr')
+
+        # Directories created after the dig need a dig of their own
+        touch(self.path('new', 'sh.1001.exr'))
+        self.assertIsNone(
+            self.cache.dirs_from_parent_dig(self.path('new'), ext='exr')
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()